@@ -26,6 +26,7 @@ def _setup_categories(client, path):
 
         for key, values in cat_data.items():
             key_type = values["data"].get("type")
+            key_info_type = values["info"].get("type")
             key_title = values["title"]
             key_desc = values["info"].get("description")
 
@@ -33,7 +34,8 @@ def _setup_categories(client, path):
                 key: {
                     "param": key,
                     "help": key_desc if key_desc else key_title,
-                    "type": key_type
+                    "type": key_type,
+                    "info_type": key_info_type
                 }
             }
             data["params"].update(to_add)
@@ -5,7 +5,12 @@ from os import environ
 from pydoitz import settings
 from pydoitz.cmdb import CMDBNamespace
 from pydoitz.idoit import IDoitNamespace
-from pydoitz.request import IDoitResponse, IDoitBatchResponse
+from pydoitz.pipeline import Pipeline
+from pydoitz.request import (
+    IDoitResponse,
+    IDoitBatchResponse,
+    IDoitStreamResponse
+)
 
 
 class IDoitSession():
@@ -27,10 +32,11 @@ class IDoitSession():
 class IDoitClient:
 
     def __init__(self, host, user=None, password=None, key=None,
-                 proto="https", language="en"):
+                 proto="https", language="en", batch_size=500):
         self.host = host
         self.proto = proto
         self._language = language
+        self.batch_size = batch_size
         self._session = None
         self._request_id = 0
 
@@ -139,11 +145,12 @@ class IDoitClient:
             data.append(self._build_json_single(method, params, req_id))
         return data
 
-    def _run_request(self, data):
+    def _run_request(self, data, stream=False):
         resp = requests.post(
             self.url,
             data=json.dumps(data),
-            headers=self._headers
+            headers=self._headers,
+            stream=stream
         )
         return resp
 
@@ -165,7 +172,31 @@ class IDoitClient:
         resp = self._run_request(req)
         return IDoitResponse(resp.json())
 
+    def pipeline(self):
+        return Pipeline(self)
+
+    def stream_request(self, method, params={}, chunk_size=65536):
+        req = self._build_json_single(method, params)
+        resp = self._run_request(req, stream=True)
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError:
+            resp.close()
+            raise
+        return IDoitStreamResponse(
+            resp.iter_content(chunk_size=chunk_size), resp=resp
+        )
+
     def batch_request(self, requests):
-        req = self._build_json_batch(requests)
-        resp = self._run_request(req)
-        return IDoitBatchResponse(resp.json())
+        if not self.batch_size or len(requests) <= self.batch_size:
+            req = self._build_json_batch(requests)
+            resp = self._run_request(req)
+            return IDoitBatchResponse(resp.json())
+
+        # Split large batches, so a single HTTP request doesn't get too big
+        out = IDoitBatchResponse([])
+        for idx in range(0, len(requests), self.batch_size):
+            req = self._build_json_batch(requests[idx:idx + self.batch_size])
+            resp = self._run_request(req)
+            out.extend(IDoitBatchResponse(resp.json()))
+        return out
@@ -1,7 +1,34 @@
+from typing import List, Dict, Optional
 from .category import (
     CategoryRequest,
     CategoryInfoRequest
 )
+from .dialog import DialogRequest
+from .object import ObjectsRequest
+from .reports import ReportsRequest
+
+
+# Fields of a Category Entry that point to other Objects
+RELATION_FIELDS = {
+    "C__CATG__LOCATION": ["parent"],
+    "C__CATG__RELATION": ["object1", "object2"],
+}
+
+
+def _extract_object_ids(value):
+    if isinstance(value, list):
+        out = []
+        for item in value:
+            out.extend(_extract_object_ids(item))
+        return out
+
+    if isinstance(value, dict):
+        value = value.get("id")
+
+    if isinstance(value, int) or isinstance(value, str) and value.isdigit():
+        return [int(value)]
+
+    return []
 
 
 class CMDBNamespace:
@@ -9,3 +36,51 @@ class CMDBNamespace:
     def __init__(self, api):
         self.category = CategoryRequest(api)
         self.category_info = CategoryInfoRequest(api)
+        self.dialog = DialogRequest(api)
+        self.objects = ObjectsRequest(api)
+        self.reports = ReportsRequest(api)
+
+    def traverse(self, object_ids: List[int], categories: List[str],
+                 max_depth: int = 1,
+                 fields: Optional[Dict[str, List[str]]] = None) -> Dict[int, List[int]]:
+        """Walk the Relations of Objects and return them as Adjacency Lists
+
+        Every level of the walk is read with a single (chunked) batch
+        request, and no Object is read more than once.
+        """
+        fields = {**RELATION_FIELDS, **(fields or {})}
+        graph = {}
+        frontier = list(dict.fromkeys(int(obj) for obj in object_ids))
+        visited = set(frontier)
+        depth = 0
+
+        while frontier and depth < max_depth:
+            entries = self.category.read_entries(frontier, categories)
+            next_frontier = []
+
+            for obj in frontier:
+                neighbours = []
+                for category in categories:
+                    for entry in entries.get((obj, category), []):
+                        for field in fields.get(category, []):
+                            neighbours.extend(
+                                _extract_object_ids(entry.get(field))
+                            )
+
+                # Keep insertion order, but remove duplicates and self-loops
+                neighbours = [n for n in dict.fromkeys(neighbours) if n != obj]
+                graph[obj] = neighbours
+
+                for neighbour in neighbours:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        next_frontier.append(neighbour)
+
+            frontier = next_frontier
+            depth += 1
+
+        # Objects on the last level were not read, but are still nodes
+        for obj in frontier:
+            graph.setdefault(obj, [])
+
+        return graph
@@ -1,11 +1,84 @@
 import pydoitz
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple
 from collections import UserDict
 from pydoitz.settings import CategoryConfig
 from pydoitz.request import IDoitRequest
 from pydoitz.exceptions import SystemError
 
 
+class SyncResult:
+
+    def __init__(self, entries, skipped):
+        self.entries = entries
+        self.skipped = skipped
+
+
+# Keys that hold the payload of reference values (dialogs, objects, ...)
+VALUE_KEYS = ("title", "id", "value", "const")
+
+
+def _as_str(value):
+    if isinstance(value, bool):
+        value = int(value)
+    return "" if value is None else str(value)
+
+
+def _coerce(value, value_type):
+    """Parse a value by its schema type, unparsable values never match"""
+    value = _as_str(value)
+
+    try:
+        if value_type == "int":
+            return int(value.strip())
+        if value_type in ("float", "double"):
+            return float(value.strip())
+    except ValueError:
+        return object()
+
+    return value
+
+
+def _scalar_matches(current, desired, value_type):
+    return (_as_str(current) == _as_str(desired)
+            or _coerce(current, value_type) == _coerce(desired, value_type))
+
+
+def _value_matches(current, desired, value_type):
+    if isinstance(current, list):
+        desired = desired if isinstance(desired, list) else [desired]
+        if len(current) != len(desired):
+            return False
+
+        # Compare as multisets: every desired item needs its own current item
+        matches = [
+            [idx for idx, cur in enumerate(current)
+             if _value_matches(cur, want, value_type)]
+            for want in desired
+        ]
+        assigned = {}
+
+        def assign(want, seen):
+            for idx in matches[want]:
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                if idx not in assigned or assign(assigned[idx], seen):
+                    assigned[idx] = want
+                    return True
+            return False
+
+        return all(assign(want, set()) for want in range(len(desired)))
+
+    if isinstance(current, dict):
+        return any(
+            _scalar_matches(current.get(key), desired, value_type)
+            for key in VALUE_KEYS
+            if current.get(key) is not None
+        )
+
+    return _scalar_matches(current, desired, value_type)
+
+
 class CategoryRequest(IDoitRequest):
 
     def __init__(self, *args, **kwargs):
@@ -27,11 +100,61 @@ class CategoryRequest(IDoitRequest):
             categories=[category],
             entry_ids=[entry_id] if entry_id is not None else [],
         )
+        self._client.cmdb.dialog.resolve_requests(reqs)
         res = self._client.batch_request(reqs)
         res.check_error()
         # TODO: Group created categories by object id
         return [result["entry"] for result in res.results()]
 
+    def sync(self, object_ids: List[int], category: str,
+             attributes: List[dict], entry_id: Optional[int] = None,
+             current: Optional[Dict[Tuple[int, str], List[dict]]] = None) -> SyncResult:
+        """Save Category Entries, but skip those that are already up to date
+
+        The current Entries are read in one batch, unless they are passed
+        in via `current` (as returned by `read_entries`).
+        """
+        if current is None:
+            current = self.read_entries(object_ids, [category])
+
+        entry = self.category_config.get(category)
+        schema = entry.fields if entry and entry.fields else {}
+
+        reqs = []
+        skipped = 0
+        for obj in object_ids:
+            entries = current.get((obj, category), [])
+            if entry_id is not None:
+                entries = [e for e in entries if str(e.get("id")) == str(entry_id)]
+
+            for req in self._build_requests(
+                method="save",
+                attributes=attributes,
+                object_ids=[obj],
+                categories=[category],
+                entry_ids=[entry_id] if entry_id is not None else [],
+            ):
+                data = req["params"].get("data", {})
+                if any(self._entry_matches(e, data, schema) for e in entries):
+                    skipped += 1
+                else:
+                    reqs.append(req)
+
+        if not reqs:
+            return SyncResult([], skipped)
+
+        self._client.cmdb.dialog.resolve_requests(reqs)
+        res = self._client.batch_request(reqs)
+        res.check_error()
+        return SyncResult([result["entry"] for result in res.results()], skipped)
+
+    def _entry_matches(self, entry, data, schema):
+        for key, value in data.items():
+            value_type = schema.get(key, {}).get("type")
+            if not _value_matches(entry.get(key), value, value_type):
+                return False
+        return True
+
     # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbcategorydelete
     def delete(self, object_ids: List[int], categories: List[str],
                entry_ids: Union[str, List[int]]) -> None:
@@ -59,6 +182,30 @@ class CategoryRequest(IDoitRequest):
         # TODO: Proper formatting
         return res
 
+    def read_entries(self, object_ids: List[int],
+                     categories: List[str]) -> Dict[Tuple[int, str], List[dict]]:
+        """Read Category Entries and group them by (Object ID, Category)"""
+        if not object_ids or not categories:
+            return {}
+
+        reqs = self._build_requests(
+            method="read",
+            object_key="objID",
+            object_ids=object_ids,
+            categories=categories,
+        )
+        req_id_map = {}
+        for req in reqs:
+            req["id"] = self._client.next_request_id()
+            params = req["params"]
+            req_id_map[req["id"]] = (params["objID"], params["category"])
+
+        out = {}
+        for res in self._client.batch_request(reqs):
+            res.check_error()
+            out[req_id_map[res.request_id]] = res.result or []
+        return out
+
     # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbcategoryupdate
     def update(self, object_ids: List[int], category: str,
              attributes: List[dict], entry_id: Optional[int] = None):
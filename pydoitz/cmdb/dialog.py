@@ -0,0 +1,172 @@
+import pydoitz
+import warnings
+from typing import List, Dict, Tuple, Optional
+from pydoitz.request import IDoitRequest
+
+
+DIALOG_TYPES = ("dialog", "dialog_plus")
+
+# Dialog+ Fields whose Entries depend on the value of another Field. Their
+# Titles are only unique per parent, so they are not resolved. More Fields
+# can be marked with "depends_on" in the category config.
+DEPENDENT_FIELDS = {
+    ("C__CATG__MODEL", "title"): "manufacturer",
+}
+
+
+def _is_id(value):
+    return isinstance(value, int) or isinstance(value, str) and value.isdigit()
+
+
+class DialogRequest(IDoitRequest):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Title -> ID of Dialog Entries per (category, property). Dialog IDs
+        # belong to the tenant (API key) and Titles depend on the language,
+        # so the cache lives on the client.
+        self._cache = {}
+        self._warned = set()
+
+    def _dialog_fields(self, category):
+        entry = self._client.cmdb.category.category_config.get(category)
+        if not entry or not entry.fields:
+            return []
+
+        if (category not in self._warned
+                and not any("info_type" in data for data in entry.fields.values())):
+            self._warned.add(category)
+            warnings.warn(
+                f"Cached schema of {category} has no dialog types, dialog "
+                "titles can't be resolved. Re-run pydoitz.cache.init to "
+                "update the cache."
+            )
+
+        return [
+            field for field, data in entry.fields.items()
+            if (data.get("type") in DIALOG_TYPES
+                or data.get("info_type") in DIALOG_TYPES)
+            and not data.get("depends_on")
+            and (category, field) not in DEPENDENT_FIELDS
+        ]
+
+    def clear_cache(self, category: Optional[str] = None,
+                    prop: Optional[str] = None) -> None:
+        if category is None:
+            self._cache.clear()
+            return None
+
+        for field in list(self._cache):
+            if field[0] == category and prop in (None, field[1]):
+                del self._cache[field]
+
+    # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbdialogread
+    def read(self, category: str, prop: str) -> Dict[str, int]:
+        self.preload([(category, prop)])
+        return self._cache[(category, prop)]
+
+    def preload(self, fields: List[Tuple[str, str]]) -> None:
+        """Read the Entries of multiple Dialog Fields in one batch request"""
+        reqs = []
+        req_id_map = {}
+
+        for field in dict.fromkeys(fields):
+            if field in self._cache:
+                continue
+
+            category, prop = field
+            req_id = self._client.next_request_id()
+            reqs.append({
+                "method": "cmdb.dialog.read",
+                "params": {"category": category, "property": prop},
+                "id": req_id
+            })
+            req_id_map[req_id] = field
+
+        if not reqs:
+            return None
+
+        for res in self._client.batch_request(reqs):
+            res.check_error()
+            self._cache[req_id_map[res.request_id]] = {
+                item["title"]: int(item["id"]) for item in res.result or []
+            }
+
+    def get_id(self, category: str, prop: str, title: str) -> Optional[int]:
+        return self.read(category, prop).get(title)
+
+    # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbdialogcreate
+    def create(self, values: List[Tuple[str, str, str]]) -> List[int]:
+        """Create Dialog Entries given as (category, property, title)"""
+        reqs = []
+        req_id_map = {}
+
+        for value in dict.fromkeys(values):
+            category, prop, title = value
+            req_id = self._client.next_request_id()
+            reqs.append({
+                "method": "cmdb.dialog.create",
+                "params": {"category": category, "property": prop, "value": title},
+                "id": req_id
+            })
+            req_id_map[req_id] = value
+
+        if not reqs:
+            return []
+
+        out = {}
+        for res in self._client.batch_request(reqs):
+            res.check_error()
+            category, prop, title = value = req_id_map[res.request_id]
+            entry_id = int(res.result["entry_id"])
+            self._cache.setdefault((category, prop), {})[title] = entry_id
+            out[value] = entry_id
+
+        return [out[value] for value in values]
+
+    def resolve_requests(self, reqs: List[dict]) -> List[dict]:
+        """Replace Dialog Titles in category save requests with their IDs
+
+        All involved Dialog Fields are read in one batch, and unknown
+        Titles are created in one batch. Dependent Fields (see
+        DEPENDENT_FIELDS) and list values (e.g. dialog_list) are passed
+        through unchanged.
+        """
+        todo = []
+        for req in reqs:
+            params = req["params"]
+            data = params.get("data")
+            if not data:
+                continue
+
+            for prop in self._dialog_fields(params["category"]):
+                value = data.get(prop)
+                if isinstance(value, str) and not _is_id(value):
+                    todo.append((params["category"], prop, value))
+
+        if not todo:
+            return reqs
+
+        self.preload([(category, prop) for category, prop, _ in todo])
+        self.create([
+            (category, prop, title) for category, prop, title in todo
+            if title not in self._cache[(category, prop)]
+        ])
+
+        for req in reqs:
+            params = req["params"]
+            data = params.get("data")
+            if not data:
+                continue
+
+            ids = {}
+            for prop in self._dialog_fields(params["category"]):
+                value = data.get(prop)
+                if isinstance(value, str) and not _is_id(value):
+                    ids[prop] = self._cache[(params["category"], prop)][value]
+
+            # Don't modify the attributes passed in by the caller
+            if ids:
+                params["data"] = {**data, **ids}
+
+        return reqs
@@ -0,0 +1,33 @@
+import pydoitz
+from typing import List, Dict, Iterator, Optional
+from pydoitz.request import IDoitRequest
+
+
+class ObjectsRequest(IDoitRequest):
+
+    # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbobjectsread
+    def read(self, object_type: Optional[str] = None, filters: Dict = None,
+             offset: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """Read Objects, optionally filtered by Object Type"""
+        params = {"filter": dict(filters or {}), "order_by": "id", "sort": "ASC"}
+        if object_type:
+            params["filter"]["type"] = object_type
+        if limit:
+            params["limit"] = f"{offset},{limit}"
+
+        resp = self._client.request("cmdb.objects.read", params)
+        resp.check_error()
+        return resp.result or []
+
+    def iter_ids(self, object_type: Optional[str] = None, filters: Dict = None,
+                 page_size: int = 500) -> Iterator[int]:
+        """Yield Object IDs page by page"""
+        offset = 0
+        while True:
+            objects = self.read(object_type, filters, offset, page_size)
+            for obj in objects:
+                yield int(obj["id"])
+
+            if len(objects) < page_size:
+                break
+            offset += page_size
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import pydoitz
+from typing import List, Dict, Iterator, Optional
+from pathlib import Path
+from pydoitz import utils
+from pydoitz.request import IDoitRequest
+
+
+class ReportsRequest(IDoitRequest):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cache = utils.get_cache(self._client.host)
+        self.cache_dir = cache / "reports" / self._cache_scope() if cache else None
+
+    def _cache_scope(self):
+        """Rows depend on the user's rights and the language"""
+        scope = "\0".join(str(item) for item in (
+            self._client.user, self._client.key, self._client._language
+        ))
+        return hashlib.sha256(scope.encode()).hexdigest()[:16]
+
+    def _cache_file(self, report_id):
+        return self.cache_dir / f"{report_id}.jsonl"
+
+    def _is_cached(self, report_id, ttl):
+        if not ttl or not self.cache_dir:
+            return False
+
+        path = self._cache_file(report_id)
+        return path.exists() and time.time() - path.stat().st_mtime < ttl
+
+    def _read_cache(self, report_id):
+        with self._cache_file(report_id).open() as f:
+            for line in f:
+                yield json.loads(line)
+
+    def _write_cache(self, report_id, rows):
+        """Write rows to the cache while passing them through"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_file(report_id)
+        # Other processes might refresh the same report at the same time
+        f = tempfile.NamedTemporaryFile(
+            "w", dir=self.cache_dir, prefix=f"{report_id}.", suffix=".tmp",
+            delete=False
+        )
+        tmp = Path(f.name)
+        done = False
+
+        try:
+            with f:
+                for row in rows:
+                    f.write(json.dumps(row) + "\n")
+                    yield row
+            done = True
+        finally:
+            # Stop the underlying stream, if the caller stopped early
+            close = getattr(rows, "close", None)
+            if close:
+                close()
+
+            # Only keep complete results
+            if done:
+                os.replace(tmp, path)
+            elif tmp.exists():
+                tmp.unlink()
+
+    # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbreportsread
+    def read_all(self) -> List[dict]:
+        """List all available Reports"""
+        resp = self._client.request("cmdb.reports.read")
+        resp.check_error()
+        return resp.result
+
+    def read(self, report_id: int, ttl: Optional[int] = None) -> Iterator[dict]:
+        """Stream the rows of a Report
+
+        If `ttl` (in seconds) is given, results are cached on disk and
+        reused as long as they are not older than `ttl`.
+        """
+        if self._is_cached(report_id, ttl):
+            return self._read_cache(report_id)
+
+        rows = iter(self._client.stream_request(
+            "cmdb.reports.read", {"id": report_id}
+        ))
+        if ttl and self.cache_dir:
+            rows = self._write_cache(report_id, rows)
+        return rows
+
+    def read_many(self, report_ids: List[int],
+                  ttl: Optional[int] = None) -> Dict[int, List[dict]]:
+        """Run multiple Reports in one batch request"""
+        out = {}
+        reqs = []
+        req_id_map = {}
+
+        for report_id in report_ids:
+            if self._is_cached(report_id, ttl):
+                out[report_id] = list(self._read_cache(report_id))
+                continue
+
+            req_id = self._client.next_request_id()
+            reqs.append({
+                "method": "cmdb.reports.read",
+                "params": {"id": report_id},
+                "id": req_id
+            })
+            req_id_map[req_id] = report_id
+
+        if reqs:
+            for res in self._client.batch_request(reqs):
+                res.check_error()
+                report_id = req_id_map[res.request_id]
+                rows = res.result or []
+                if ttl and self.cache_dir:
+                    # Exhaust the generator, so the cache file gets written
+                    rows = list(self._write_cache(report_id, rows))
+                out[report_id] = rows
+
+        return {report_id: out[report_id] for report_id in report_ids}
+
+    def clear_cache(self, report_id: Optional[int] = None) -> None:
+        if not self.cache_dir or not self.cache_dir.exists():
+            return None
+
+        paths = ([self._cache_file(report_id)] if report_id is not None
+                 else self.cache_dir.glob("*.jsonl"))
+        for path in paths:
+            if path.exists():
+                path.unlink()
@@ -0,0 +1,133 @@
+import sys
+import csv
+import json
+import argparse
+from itertools import islice
+from typing import List, Iterator, Optional, TextIO
+from pydoitz.client import IDoitClient
+from pydoitz.cmdb.category import VALUE_KEYS
+from pydoitz.settings import CategoryConfig
+
+
+FORMATS = ["jsonl", "csv"]
+# Prefixed, so they can't collide with the fields of a category
+BASE_COLUMNS = ["@object", "@category", "@entry"]
+
+
+def _flatten_value(value):
+    if isinstance(value, list):
+        return "; ".join(str(_flatten_value(item)) for item in value)
+
+    if isinstance(value, dict):
+        for key in VALUE_KEYS:
+            if value.get(key) is not None:
+                return value[key]
+        return ""
+
+    return "" if value is None else value
+
+
+def get_columns(category_config: CategoryConfig, categories: List[str]) -> List[str]:
+    """Build the Export Columns from the cached Category Schema"""
+    columns = list(BASE_COLUMNS)
+    for category in categories:
+        entry = category_config.get(category)
+        if not entry or not entry.fields:
+            raise ValueError(
+                f"No cached schema for category {category}. "
+                "Initialize the cache first."
+            )
+        for field in entry.fields:
+            if field not in columns:
+                columns.append(field)
+    return columns
+
+
+def iter_records(client, object_ids: Iterator[int], categories: List[str],
+                 batch_size: int = 100) -> Iterator[dict]:
+    """Read Categories batch by batch and yield flattened Entries"""
+    object_ids = iter(object_ids)
+    while True:
+        batch = list(islice(object_ids, batch_size))
+        if not batch:
+            break
+
+        entries = client.cmdb.category.read_entries(batch, categories)
+        for obj in batch:
+            for category in categories:
+                for entry in entries.get((obj, category), []):
+                    record = {
+                        key: _flatten_value(value)
+                        for key, value in entry.items()
+                        if key not in ("id", "objID")
+                    }
+                    record.update({
+                        "@object": obj,
+                        "@category": category,
+                        "@entry": entry.get("id"),
+                    })
+                    yield record
+
+
+def export(client, fp: TextIO, categories: List[str],
+           object_type: Optional[str] = None,
+           object_ids: Optional[List[int]] = None,
+           fmt: str = "jsonl", batch_size: int = 100) -> int:
+    """Stream Category Entries of Objects to a JSONL or CSV File
+
+    Only one batch of Objects is held in memory at a time. Returns the
+    number of written records.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    columns = get_columns(client.cmdb.category.category_config, categories)
+    if object_ids is None:
+        object_ids = client.cmdb.objects.iter_ids(object_type, page_size=batch_size)
+
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(fp, fieldnames=columns, restval="",
+                                extrasaction="ignore")
+        writer.writeheader()
+
+    cnt = 0
+    for record in iter_records(client, object_ids, categories, batch_size):
+        if writer:
+            writer.writerow(record)
+        else:
+            fp.write(json.dumps(
+                {col: record.get(col, "") for col in columns}
+            ) + "\n")
+        cnt += 1
+
+    return cnt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pydoitz.export",
+        description="Export Category Entries of Objects to JSONL or CSV"
+    )
+    parser.add_argument("categories", nargs="+", help="Category constants")
+    parser.add_argument("-t", "--type", dest="object_type",
+                        help="Object Type constant, e.g. C__OBJTYPE__SERVER")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument("-b", "--batch-size", type=int, default=100)
+    parser.add_argument("--host")
+    parser.add_argument("--user")
+    args = parser.parse_args(argv)
+
+    client = IDoitClient(host=args.host, user=args.user)
+    fp = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        export(client, fp, args.categories, object_type=args.object_type,
+               fmt=args.format, batch_size=args.batch_size)
+    finally:
+        if args.output:
+            fp.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import pydoitz
+from typing import List, Dict, Optional, Union
+
+
+def _check_ref_name(name, reserved):
+    if name.startswith("_") or name in reserved:
+        raise AttributeError(name)
+
+
+class PipelineRef:
+    """Reference to (a part of) the result of an earlier Pipeline Step"""
+
+    def __init__(self, step, path=()):
+        self._step = step
+        self._path = path
+
+    def __getattr__(self, name):
+        _check_ref_name(name, ("resolve",))
+        return PipelineRef(self._step, self._path + (name,))
+
+    def __getitem__(self, key):
+        return PipelineRef(self._step, self._path + (key,))
+
+    def resolve(self):
+        value = self._step.result
+        for key in self._path:
+            value = value[key]
+        return value
+
+
+class PipelineStep:
+    """A single request in a Pipeline
+
+    Accessing unknown attributes (e.g. `step.id`) returns a reference to
+    that key of the result, which can be used in the params of later steps.
+    Keys that clash with the attributes of the step have to be referenced
+    as `step["key"]`.
+    """
+
+    ATTRIBUTES = ("method", "params", "deps", "level", "result", "error")
+
+    def __init__(self, method, params, deps):
+        self.method = method
+        self.params = params
+        self.deps = deps
+        self.level = max((dep.level + 1 for dep in deps), default=0)
+        self.result = None
+        self.error = None
+
+    def __getattr__(self, name):
+        _check_ref_name(name, self.ATTRIBUTES)
+        return PipelineRef(self, (name,))
+
+    def __getitem__(self, key):
+        return PipelineRef(self, (key,))
+
+
+def _find_refs(value):
+    if isinstance(value, PipelineRef):
+        return [value._step]
+    if isinstance(value, PipelineStep):
+        raise TypeError(
+            "Pipeline steps can't be used as params directly, "
+            "reference a key of their result instead, e.g. step.id"
+        )
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        out = []
+        for item in value:
+            out.extend(_find_refs(item))
+        return out
+    return []
+
+
+def _resolve_refs(value):
+    if isinstance(value, PipelineRef):
+        return value.resolve()
+    if isinstance(value, dict):
+        return {key: _resolve_refs(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_resolve_refs(item) for item in value]
+    return value
+
+
+class Pipeline:
+    """Batch requests that depend on the results of other requests
+
+    Steps are grouped into levels by their dependencies, and every level
+    is sent as one batch request.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._done = False
+        self.steps = []
+
+    def _check_not_run(self):
+        if self._done:
+            raise ValueError("Pipeline has already been run.")
+
+    def add(self, method: str, params: Dict = None) -> PipelineStep:
+        self._check_not_run()
+        params = params or {}
+        deps = list(dict.fromkeys(_find_refs(params)))
+        step = PipelineStep(method, params, deps)
+        self.steps.append(step)
+        return step
+
+    # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbobjectcreate
+    def object_create(self, object_type: str, title: str, **params) -> PipelineStep:
+        return self.add("cmdb.object.create", {
+            "type": object_type,
+            "title": title,
+            **params
+        })
+
+    # https://kb.i-doit.com/en/i-doit-pro-add-ons/api/methods.html#cmdbcategorysave
+    def category_save(self, object_ids: List[Union[int, PipelineRef]], category: str,
+                      attributes: List[dict],
+                      entry_id: Optional[int] = None) -> List[PipelineStep]:
+        reqs = self._client.cmdb.category._build_requests(
+            method="save",
+            attributes=attributes,
+            object_ids=object_ids,
+            categories=[category],
+            entry_ids=[entry_id] if entry_id is not None else [],
+        )
+        return [self.add(req["method"], req["params"]) for req in reqs]
+
+    def run(self, raise_errors: bool = True) -> List[PipelineStep]:
+        """Run all Steps, one batch request per level
+
+        If `raise_errors` is False, failed Steps keep their error and all
+        Steps depending on them are skipped. A Pipeline can only be run
+        once.
+        """
+        self._check_not_run()
+        self._done = True
+
+        levels = {}
+        for step in self.steps:
+            levels.setdefault(step.level, []).append(step)
+
+        for level in sorted(levels):
+            reqs = []
+            req_id_map = {}
+
+            for step in levels[level]:
+                failed = [dep for dep in step.deps if dep.error]
+                if failed:
+                    step.error = failed[0].error
+                    continue
+
+                req_id = self._client.next_request_id()
+                reqs.append({
+                    "method": step.method,
+                    "params": _resolve_refs(step.params),
+                    "id": req_id
+                })
+                req_id_map[req_id] = step
+
+            if not reqs:
+                continue
+
+            self._client.cmdb.dialog.resolve_requests([
+                req for req in reqs if req["method"] == "cmdb.category.save"
+            ])
+            for res in self._client.batch_request(reqs):
+                step = req_id_map.get(res.request_id)
+                if step is None:
+                    # Errors of the whole batch (e.g. failed auth) have no id
+                    res.check_error()
+                    raise ValueError(f"Unexpected response id: {res.request_id}")
+
+                step.result = res.result
+                step.error = res.error
+
+            if raise_errors:
+                for step in levels[level]:
+                    if step.error:
+                        raise step.error
+
+        return self.steps
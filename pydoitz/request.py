@@ -1,4 +1,5 @@
 import json
+import codecs
 from pydoitz.exceptions import IDoitError
 
 
@@ -58,3 +59,124 @@ class IDoitRequest:
 
     def __init__(self, client):
         self._client = client
+
+
+class IDoitStreamResponse():
+    """Response whose "result" list is parsed item by item while reading
+
+    Iterating over the Response yields the items of the result. All other
+    top-level keys (like "id" or "error") are available once it is
+    exhausted. The underlying HTTP response `resp` is closed when the
+    iteration ends or is stopped early.
+    """
+
+    def __init__(self, chunks, key="result", resp=None):
+        self._chunks = iter(chunks)
+        self._resp = resp
+        self._key = key
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.json = {}
+        self.error = None
+        self.version = None
+        self.request_id = None
+
+    def _fill(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            return False
+
+        if isinstance(chunk, bytes):
+            chunk = self._utf8.decode(chunk)
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, got {char!r}")
+        self._pos += 1
+        return char
+
+    def _decode(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            # Numbers and literals could continue in the next chunk, so
+            # only accept the value if it is followed by a delimiter
+            nxt = end
+            while nxt < len(self._buf) and self._buf[nxt].isspace():
+                nxt += 1
+
+            if nxt == len(self._buf):
+                if self._fill():
+                    continue
+            elif self._buf[nxt] not in ",:]}":
+                if self._fill():
+                    continue
+                raise ValueError(
+                    f"Unexpected {self._buf[nxt]!r} in JSON stream"
+                )
+
+            self._pos = end
+            return value
+
+    def __iter__(self):
+        try:
+            yield from self._iter_result()
+        finally:
+            self.close()
+
+    def _iter_result(self):
+        self._expect("{")
+        while self._peek() != "}":
+            key = self._decode()
+            self._expect(":")
+            if key == self._key:
+                self._expect("[")
+                while self._peek() != "]":
+                    yield self._decode()
+                    if self._peek() == ",":
+                        self._pos += 1
+                self._pos += 1
+            else:
+                self.json[key] = self._decode()
+
+            if self._expect(",}") == "}":
+                break
+
+        self.version = self.json.get("jsonrpc")
+        self.request_id = self.json.get("id")
+        self.error = IDoitError.from_resp(self.json)
+        self.check_error()
+
+    def close(self):
+        if self._resp is not None:
+            self._resp.close()
+            self._resp = None
+
+    def check_error(self):
+        if self.error:
+            raise self.error
+        else:
+            return self
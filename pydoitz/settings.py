@@ -82,8 +82,10 @@ class CategoryConfigEntry:
         if user_entry.cli_name:
             self.cli_name = user_entry.cli_name
 
-        for param in list(self.fields.keys()):
-            user_data = user_entry.fields.get(param, {})
+        self.fields = self.fields or {}
+        user_fields = user_entry.fields or {}
+        for param in list(dict.fromkeys([*self.fields, *user_fields])):
+            user_data = user_fields.get(param, {})
             cache_data = self.fields.get(param, {})
             self.fields[param] = {**cache_data, **user_data}
 
@@ -103,7 +105,8 @@ class CategoryConfig:
         for entry_name, entry in user_entries.items():
             if entry_name in self.entries:
                 self.entries[entry_name].merge(entry)
-            self.entries[entry_name] = entry
+            else:
+                self.entries[entry_name] = entry
 
     def __contains__(self, entry):
         return True if entry.name in self.entries else False
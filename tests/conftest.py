@@ -0,0 +1,82 @@
+import json
+import pytest
+from pydoitz.client import IDoitClient
+
+
+class FakeError:
+
+    def __init__(self, code, message):
+        self.code = code
+        self.message = message
+
+
+class FakeHTTPResponse:
+
+    def __init__(self, data):
+        self.data = data
+        self.closed = False
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        # Small chunks, to exercise the stream parser
+        content = json.dumps(self.data).encode()
+        return [content[idx:idx + 7] for idx in range(0, len(content), 7)]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient(IDoitClient):
+    """Client that answers requests with `handler(method, params)`
+
+    The handler returns the result of a request, or a FakeError.
+    """
+
+    def __init__(self, handler, **kwargs):
+        self.handler = handler
+        self.calls = []
+        super().__init__("fakehost", key="key", **kwargs)
+
+    def _respond(self, req):
+        result = self.handler(req["method"], req["params"])
+        if isinstance(result, FakeError):
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": result.code, "message": result.message},
+                "id": req["id"]
+            }
+        return {"jsonrpc": "2.0", "result": result, "id": req["id"]}
+
+    def _run_request(self, data, stream=False):
+        self.calls.append(data)
+        if isinstance(data, list):
+            return FakeHTTPResponse([self._respond(req) for req in data])
+        return FakeHTTPResponse(self._respond(data))
+
+
+@pytest.fixture(autouse=True)
+def xdg_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    for var in ("IDOIT_API_USER", "IDOIT_API_PASS", "IDOIT_API_KEY", "IDOIT_API_HOST"):
+        monkeypatch.delenv(var, raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def write_schema(xdg_home):
+    """Write a categories.json cache for the fake host"""
+    def write(categories):
+        path = xdg_home / "cache" / "fakehost"
+        path.mkdir(parents=True, exist_ok=True)
+        data = [
+            {"name": name, "cli_name": name.casefold(), "params": params}
+            for name, params in categories.items()
+        ]
+        (path / "categories.json").write_text(json.dumps(data))
+    return write
@@ -0,0 +1,113 @@
+import json
+import pytest
+from conftest import FakeClient
+from pydoitz.cmdb.category import _value_matches
+
+
+@pytest.mark.parametrize("current, desired", [
+    ([{"id": "1", "title": "a"}, {"id": "2", "title": "b"}], ["b", "a"]),
+    ([{"id": "1", "title": "a"}, {"id": "2", "title": "b"}], [2, 1]),
+    # "2" matches both items, so the first one has to be re-assigned
+    ([{"id": "1", "title": "2"}, {"id": "2", "title": "x"}], ["x", "1"]),
+    ([{"id": "1", "title": "a"}, {"id": "1", "title": "a"}], ["a", "a"]),
+])
+def test_multiset_match(current, desired):
+    assert _value_matches(current, desired, "int")
+
+
+@pytest.mark.parametrize("current, desired", [
+    ([{"id": "1", "title": "a"}, {"id": "2", "title": "b"}], ["a", "a"]),
+    ([{"id": "1", "title": "a"}, {"id": "2", "title": "b"}], ["a"]),
+    ([{"id": "1", "title": "a"}], ["a", "a"]),
+])
+def test_multiset_mismatch(current, desired):
+    assert not _value_matches(current, desired, "int")
+
+
+@pytest.mark.parametrize("current, desired, value_type", [
+    ("16", 16, "int"),
+    (" 16", 16, "int"),
+    ("16", 16.0, "double"),
+    ("1", True, "int"),
+    ("12345678901234567891", 12345678901234567891, "int"),
+    ({"id": "3", "title": "Dell"}, "Dell", "int"),
+    ({"id": "3", "title": "Dell"}, 3, "int"),
+    ({"title": "Yes", "value": "1"}, 1, "int"),
+    ("abc", "abc", "text"),
+])
+def test_typed_match(current, desired, value_type):
+    assert _value_matches(current, desired, value_type)
+
+
+@pytest.mark.parametrize("current, desired, value_type", [
+    ("1.9", 1, "int"),
+    ("12345678901234567891", 12345678901234567890, "int"),
+    ("x", "y", "int"),
+    ("a ", "a", "text"),
+    ("a ", "a", None),
+    ({"id": "3", "title": "Dell"}, "HP", "int"),
+])
+def test_typed_mismatch(current, desired, value_type):
+    assert not _value_matches(current, desired, value_type)
+
+
+def _sync_handler(entries):
+    def handler(method, params):
+        if method == "cmdb.category.read":
+            return entries.get(params["objID"], [])
+        return {"success": True, "entry": params["object"] * 10}
+    return handler
+
+
+def test_sync_skips_unchanged(write_schema):
+    write_schema({"C__CATG__GLOBAL": {
+        "description": {"param": "description", "type": "text"},
+        "purpose": {"param": "purpose", "type": "int", "info_type": "dialog_plus"},
+    }})
+    entries = {
+        1: [{"id": "5", "description": "a", "purpose": {"id": "2", "title": "Prod"}}],
+        2: [{"id": "6", "description": "a ", "purpose": {"id": "2", "title": "Prod"}}],
+    }
+    client = FakeClient(_sync_handler(entries))
+
+    res = client.cmdb.category.sync(
+        [1, 2, 3], "C__CATG__GLOBAL", [{"description": "a", "purpose": 2}]
+    )
+
+    assert res.skipped == 1
+    assert res.entries == [20, 30]
+    saves = client.calls[-1]
+    assert [req["params"]["object"] for req in saves] == [2, 3]
+
+
+def test_sync_reuses_current(write_schema):
+    write_schema({"C__CATG__GLOBAL": {"description": {"param": "description", "type": "text"}}})
+    client = FakeClient(_sync_handler({}))
+    current = {(1, "C__CATG__GLOBAL"): [{"id": "5", "description": "a"}]}
+
+    res = client.cmdb.category.sync(
+        [1], "C__CATG__GLOBAL", [{"description": "a"}], current=current
+    )
+
+    assert res.skipped == 1
+    assert res.entries == []
+    assert client.calls == []
+
+
+def test_sync_uses_types_with_user_config(xdg_home, write_schema):
+    write_schema({"C__CATG__MEMORY": {"capacity": {"param": "capacity", "type": "double"}}})
+    conf = xdg_home / "config"
+    conf.mkdir()
+    (conf / "categories.json").write_text(json.dumps([{
+        "name": "C__CATG__MEMORY",
+        "cli_name": "mem",
+        "params": {"capacity": {"param": "size"}},
+    }]))
+    entries = {1: [{"id": "5", "capacity": "16.00"}]}
+    client = FakeClient(_sync_handler(entries))
+
+    fields = client.cmdb.category.category_config.get("C__CATG__MEMORY").fields
+    assert fields["capacity"] == {"param": "size", "type": "double"}
+
+    res = client.cmdb.category.sync([1], "C__CATG__MEMORY", [{"size": 16}])
+    assert res.skipped == 1
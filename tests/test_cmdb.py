@@ -0,0 +1,75 @@
+from conftest import FakeClient
+
+
+LOCATION = "C__CATG__LOCATION"
+RELATION = "C__CATG__RELATION"
+
+
+def _location_handler(parents, reads):
+    def handler(method, params):
+        reads.append(params["objID"])
+        parent = parents.get(params["objID"])
+        if parent is None:
+            return []
+        return [{"id": "1", "parent": {"id": str(parent), "title": "x"}}]
+    return handler
+
+
+def test_traverse_depth():
+    reads = []
+    client = FakeClient(_location_handler({1: 2, 2: 3, 3: 4}, reads))
+
+    assert client.cmdb.traverse([1], [LOCATION], max_depth=10) == {
+        1: [2], 2: [3], 3: [4], 4: []
+    }
+    assert len(client.calls) == 4
+
+    reads.clear()
+    assert client.cmdb.traverse([1], [LOCATION], max_depth=2) == {
+        1: [2], 2: [3], 3: []
+    }
+    assert reads == [1, 2]
+
+
+def test_traverse_visits_once():
+    reads = []
+    # 1 and 2 share the parent 3, and 3 points back to 1
+    client = FakeClient(_location_handler({1: 3, 2: 3, 3: 1}, reads))
+
+    graph = client.cmdb.traverse([1, 2, 1], [LOCATION], max_depth=5)
+
+    assert graph == {1: [3], 2: [3], 3: [1]}
+    assert sorted(reads) == [1, 2, 3]
+    assert len(client.calls) == 2
+
+
+def test_traverse_levels_are_chunked():
+    reads = []
+    client = FakeClient(
+        _location_handler({idx: 100 for idx in range(10)}, reads), batch_size=4
+    )
+
+    graph = client.cmdb.traverse(list(range(10)), [LOCATION], max_depth=2)
+
+    assert graph[100] == []
+    # First level: 10 requests in chunks of 4, second level: one request
+    assert [len(call) for call in client.calls] == [4, 4, 2, 1]
+
+
+def test_traverse_relations_and_custom_fields():
+    def handler(method, params):
+        if params["category"] == RELATION:
+            return [
+                {"id": "1", "object1": {"id": "1"}, "object2": {"id": "5"}},
+                {"id": "2", "object1": {"id": "6"}, "object2": {"id": "1"}},
+            ]
+        return [{"id": "1", "assigned": [{"id": "7"}, {"id": 8}, "9", None]}]
+
+    client = FakeClient(handler)
+    graph = client.cmdb.traverse(
+        [1], [RELATION, "C__CATG__CUSTOM"], max_depth=1,
+        fields={"C__CATG__CUSTOM": ["assigned"]}
+    )
+
+    assert graph[1] == [5, 6, 7, 8, 9]
+    assert len(client.calls) == 1
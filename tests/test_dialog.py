@@ -0,0 +1,90 @@
+import json
+import warnings
+import pytest
+from conftest import FakeClient
+
+
+def _handler(method, params):
+    if method == "cmdb.dialog.read":
+        return [{"id": "3", "title": "Dell", "const": ""}]
+    if method == "cmdb.dialog.create":
+        return {"success": True, "entry_id": "42"}
+    return {"success": True, "entry": 1}
+
+
+MODEL_SCHEMA = {"C__CATG__MODEL": {
+    "manufacturer": {"param": "manufacturer", "type": "int", "info_type": "dialog_plus"},
+    "title": {"param": "title", "type": "int", "info_type": "dialog_plus"},
+    "serial": {"param": "serial", "type": "text", "info_type": "text"},
+}}
+
+
+def _saved_data(client):
+    return [req["params"]["data"] for req in client.calls[-1]]
+
+
+def test_resolve_and_create_once(write_schema):
+    write_schema(MODEL_SCHEMA)
+    client = FakeClient(_handler)
+    attrs = [{"manufacturer": "Dell", "serial": "a"}]
+
+    client.cmdb.category.save([1, 2], "C__CATG__MODEL", attrs)
+    assert _saved_data(client) == [{"manufacturer": 3, "serial": "a"}] * 2
+    assert attrs == [{"manufacturer": "Dell", "serial": "a"}]
+
+    client.cmdb.category.save([1, 2], "C__CATG__MODEL", [{"manufacturer": "HP"}])
+    client.cmdb.category.save([3], "C__CATG__MODEL", [{"manufacturer": "HP"}])
+    methods = [req["method"] for call in client.calls for req in call]
+    assert methods.count("cmdb.dialog.read") == 1
+    assert methods.count("cmdb.dialog.create") == 1
+    assert _saved_data(client) == [{"manufacturer": 42}]
+
+
+def test_dependent_fields_are_not_resolved(write_schema):
+    write_schema(MODEL_SCHEMA)
+    client = FakeClient(_handler)
+
+    client.cmdb.category.save([1], "C__CATG__MODEL", [{"title": "R740"}])
+    assert _saved_data(client) == [{"title": "R740"}]
+    assert len(client.calls) == 1
+
+
+def test_resolve_with_user_config(xdg_home, write_schema):
+    write_schema(MODEL_SCHEMA)
+    conf = xdg_home / "config"
+    conf.mkdir()
+    (conf / "categories.json").write_text(json.dumps([{
+        "name": "C__CATG__MODEL",
+        "cli_name": "model",
+        "params": {"manufacturer": {"param": "vendor"}},
+    }]))
+    client = FakeClient(_handler)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        client.cmdb.category.save([1], "C__CATG__MODEL", [{"vendor": "Dell"}])
+    assert _saved_data(client) == [{"manufacturer": 3}]
+
+
+def test_warn_on_old_cache(write_schema):
+    write_schema({"C__CATG__MODEL": {
+        "manufacturer": {"param": "manufacturer", "type": "int"},
+    }})
+    client = FakeClient(_handler)
+
+    with pytest.warns(UserWarning, match="cache.init"):
+        client.cmdb.category.save([1], "C__CATG__MODEL", [{"manufacturer": "Dell"}])
+
+
+def test_cache_per_client(write_schema):
+    write_schema(MODEL_SCHEMA)
+    first = FakeClient(_handler)
+    second = FakeClient(_handler)
+
+    first.cmdb.dialog.preload([("C__CATG__MODEL", "manufacturer")])
+    second.cmdb.dialog.preload([("C__CATG__MODEL", "manufacturer")])
+    assert len(first.calls) == len(second.calls) == 1
+
+    first.cmdb.dialog.clear_cache("C__CATG__MODEL")
+    first.cmdb.dialog.preload([("C__CATG__MODEL", "manufacturer")])
+    assert len(first.calls) == 2
@@ -0,0 +1,44 @@
+import io
+import csv
+import json
+from conftest import FakeClient
+from pydoitz.export import export
+
+
+def _handler(method, params):
+    return [{
+        "id": "9",
+        "objID": str(params["objID"]),
+        "title": f"obj{params['objID']}",
+        "category": {"id": "1", "title": "Production"},
+    }]
+
+
+def test_base_columns_dont_collide(write_schema):
+    write_schema({"C__CATG__GLOBAL": {
+        "title": {"param": "title", "type": "text"},
+        "category": {"param": "category", "type": "int"},
+    }})
+    client = FakeClient(_handler)
+    out = io.StringIO()
+
+    assert export(client, out, ["C__CATG__GLOBAL"], object_ids=[1, 2],
+                  fmt="csv") == 2
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert list(rows[0]) == ["@object", "@category", "@entry", "title", "category"]
+    assert rows[0]["@category"] == "C__CATG__GLOBAL"
+    assert rows[0]["category"] == "Production"
+    assert rows[1]["@object"] == "2"
+
+
+def test_jsonl_batches(write_schema):
+    write_schema({"C__CATG__GLOBAL": {"title": {"param": "title", "type": "text"}}})
+    client = FakeClient(_handler)
+    out = io.StringIO()
+
+    export(client, out, ["C__CATG__GLOBAL"], object_ids=range(5), batch_size=2)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [rec["@object"] for rec in records] == [0, 1, 2, 3, 4]
+    assert len(client.calls) == 3
@@ -0,0 +1,125 @@
+import pytest
+from conftest import FakeClient, FakeError, FakeHTTPResponse
+from pydoitz.exceptions import IDoitError, InvalidParamsError
+
+
+def _handler(method, params):
+    if method == "cmdb.object.create":
+        if params["title"] == "broken":
+            return FakeError(-32602, "Invalid title")
+        return {"id": 100 + int(params["title"][1:]), "success": True}
+    if method == "cmdb.category.save":
+        return {"entry": params["object"] * 10, "success": True}
+    return {"success": True}
+
+
+def test_levels_and_references():
+    client = FakeClient(_handler)
+    pipeline = client.pipeline()
+    saves = []
+    for idx in range(20):
+        obj = pipeline.object_create("C__OBJTYPE__SERVER", f"s{idx}")
+        saves += pipeline.category_save([obj.id], "C__CATG__GLOBAL", [{"purpose": "x"}])
+        saves += pipeline.category_save([obj["id"]], "C__CATG__MODEL", [{"serial": "y"}])
+
+    pipeline.run()
+
+    assert len(client.calls) == 2
+    assert [req["method"] for req in client.calls[0]] == ["cmdb.object.create"] * 20
+    assert client.calls[1][0]["params"]["object"] == 100
+    assert saves[0].level == 1
+    assert saves[0].result == {"entry": 1000, "success": True}
+    assert saves[-1].result == {"entry": 1190, "success": True}
+
+
+def test_nested_references():
+    client = FakeClient(_handler)
+    pipeline = client.pipeline()
+    obj = pipeline.object_create("C__OBJTYPE__SERVER", "s1")
+    step = pipeline.add("cmdb.test", {"ids": [obj.id], "nested": {"obj": obj["id"]}})
+
+    pipeline.run()
+
+    assert client.calls[1][0]["params"]["ids"] == [101]
+    assert client.calls[1][0]["params"]["nested"] == {"obj": 101}
+    assert step.deps == [obj]
+
+
+def test_error_raises():
+    client = FakeClient(_handler)
+    pipeline = client.pipeline()
+    obj = pipeline.object_create("C__OBJTYPE__SERVER", "broken")
+    pipeline.category_save([obj.id], "C__CATG__GLOBAL", [{"purpose": "x"}])
+
+    with pytest.raises(InvalidParamsError):
+        pipeline.run()
+    assert len(client.calls) == 1
+
+
+def test_error_skips_dependents():
+    client = FakeClient(_handler)
+    pipeline = client.pipeline()
+    broken = pipeline.object_create("C__OBJTYPE__SERVER", "broken")
+    good = pipeline.object_create("C__OBJTYPE__SERVER", "s1")
+    broken_save, = pipeline.category_save([broken.id], "C__CATG__GLOBAL", [{"a": 1}])
+    good_save, = pipeline.category_save([good.id], "C__CATG__GLOBAL", [{"a": 1}])
+
+    pipeline.run(raise_errors=False)
+
+    assert isinstance(broken_save.error, InvalidParamsError)
+    assert broken_save.result is None
+    assert good_save.result == {"entry": 1010, "success": True}
+    assert len(client.calls[1]) == 1
+
+
+class BatchErrorClient(FakeClient):
+
+    def _run_request(self, data, stream=False):
+        self.calls.append(data)
+        return FakeHTTPResponse({
+            "jsonrpc": "2.0",
+            "error": {"code": -32604, "message": "Authentication failed"},
+            "id": None
+        })
+
+
+def test_batch_error():
+    client = BatchErrorClient(_handler)
+    pipeline = client.pipeline()
+    pipeline.object_create("C__OBJTYPE__SERVER", "s1")
+
+    with pytest.raises(IDoitError, match="Authentication failed"):
+        pipeline.run()
+
+
+def test_reserved_names():
+    pipeline = FakeClient(_handler).pipeline()
+    obj = pipeline.object_create("C__OBJTYPE__SERVER", "s1")
+
+    assert obj.result is None
+    assert hasattr(obj, "errors")
+    assert obj["result"]._path == ("result",)
+    with pytest.raises(AttributeError):
+        obj._private
+    with pytest.raises(AttributeError):
+        obj.id._private
+
+
+def test_bare_step_is_rejected():
+    pipeline = FakeClient(_handler).pipeline()
+    obj = pipeline.object_create("C__OBJTYPE__SERVER", "s1")
+
+    with pytest.raises(TypeError, match="step.id"):
+        pipeline.add("cmdb.test", {"object": obj})
+    assert pipeline.steps == [obj]
+
+
+def test_run_once():
+    pipeline = FakeClient(_handler).pipeline()
+    pipeline.object_create("C__OBJTYPE__SERVER", "s1")
+    pipeline.run()
+
+    with pytest.raises(ValueError):
+        pipeline.run()
+    with pytest.raises(ValueError):
+        pipeline.object_create("C__OBJTYPE__SERVER", "s2")
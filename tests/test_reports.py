@@ -0,0 +1,71 @@
+from conftest import FakeClient
+
+
+def _handler(method, params):
+    return [{"report": params["id"], "row": idx} for idx in range(3)]
+
+
+def _rows(report_id):
+    return [{"report": report_id, "row": idx} for idx in range(3)]
+
+
+def test_read_streams_rows():
+    client = FakeClient(_handler)
+    assert list(client.cmdb.reports.read(5)) == _rows(5)
+    assert list(client.cmdb.reports.read(5)) == _rows(5)
+    assert len(client.calls) == 2
+
+
+def test_read_cache():
+    client = FakeClient(_handler)
+    reports = client.cmdb.reports
+
+    assert list(reports.read(5, ttl=60)) == _rows(5)
+    assert list(reports.read(5, ttl=60)) == _rows(5)
+    assert len(client.calls) == 1
+    assert [path.name for path in reports.cache_dir.iterdir()] == ["5.jsonl"]
+
+    reports.clear_cache(5)
+    assert list(reports.read(5, ttl=60)) == _rows(5)
+    assert len(client.calls) == 2
+
+
+def test_incomplete_read_is_not_cached():
+    client = FakeClient(_handler)
+    reports = client.cmdb.reports
+
+    rows = reports.read(5, ttl=60)
+    next(rows)
+    rows.close()
+
+    assert list(reports.cache_dir.iterdir()) == []
+
+
+def test_cache_scoped_by_key_and_language():
+    first = FakeClient(_handler)
+    other_lang = FakeClient(_handler, language="de")
+    same = FakeClient(_handler)
+
+    list(first.cmdb.reports.read(5, ttl=60))
+    list(other_lang.cmdb.reports.read(5, ttl=60))
+    list(same.cmdb.reports.read(5, ttl=60))
+
+    assert len(other_lang.calls) == 1
+    assert same.calls == []
+    assert first.cmdb.reports.cache_dir != other_lang.cmdb.reports.cache_dir
+
+    other_key = FakeClient(_handler)
+    other_key.key = "other"
+    assert other_key.cmdb.reports._cache_scope() != first.cmdb.reports._cache_scope()
+
+
+def test_read_many_one_batch():
+    client = FakeClient(_handler)
+    reports = client.cmdb.reports
+
+    list(reports.read(1, ttl=60))
+    out = reports.read_many([1, 2, 3], ttl=60)
+
+    assert out == {report_id: _rows(report_id) for report_id in (1, 2, 3)}
+    assert len(client.calls) == 2
+    assert len(client.calls[-1]) == 2
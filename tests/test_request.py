@@ -0,0 +1,93 @@
+import json
+import pytest
+from pydoitz.exceptions import InvalidParamsError
+from pydoitz.request import IDoitStreamResponse
+
+
+def _chunks(data, size):
+    return [data[idx:idx + size] for idx in range(0, len(data), size)]
+
+
+def _stream(doc, size):
+    return IDoitStreamResponse(_chunks(json.dumps(doc, ensure_ascii=False).encode(), size))
+
+
+class FakeHTTPResponse:
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_split_numbers(size):
+    result = [1.5, 1.5e10, -12345678901234567890, 0, True, None, 1]
+    resp = _stream({"jsonrpc": "2.0", "result": result, "id": 12345}, size)
+    assert list(resp) == result
+    assert resp.request_id == 12345
+
+
+def test_split_fraction():
+    resp = IDoitStreamResponse([b'{"result":[1.', b'5]}'])
+    assert list(resp) == [1.5]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+def test_split_utf8(size):
+    result = [{"title": "Größe €", "n": idx} for idx in range(3)]
+    resp = _stream({"id": 1, "jsonrpc": "2.0", "result": result}, size)
+    assert list(resp) == result
+
+
+@pytest.mark.parametrize("size", [1, 4, 64])
+@pytest.mark.parametrize("doc", [
+    {"id": 7, "jsonrpc": "2.0", "result": [{"a": 1}]},
+    {"result": [{"a": 1}], "jsonrpc": "2.0", "id": 7},
+    {"jsonrpc": "2.0", "result": [{"a": 1}], "id": 7},
+])
+def test_keys_around_result(doc, size):
+    resp = _stream(doc, size)
+    assert list(resp) == [{"a": 1}]
+    assert resp.request_id == 7
+    assert resp.version == "2.0"
+
+
+@pytest.mark.parametrize("size", [1, 64])
+@pytest.mark.parametrize("doc", [
+    {"jsonrpc": "2.0", "error": {"code": -32602, "message": "bad"}, "id": 1},
+    {"error": {"code": -32602, "message": "bad"}, "id": 1, "jsonrpc": "2.0"},
+])
+def test_error(doc, size):
+    resp = _stream(doc, size)
+    with pytest.raises(InvalidParamsError):
+        list(resp)
+    assert resp.request_id == 1
+
+
+def test_empty_result():
+    resp = IDoitStreamResponse([b'{"result": [ ] , "id": 3}'])
+    assert list(resp) == []
+    assert resp.request_id == 3
+
+
+def test_invalid_document():
+    with pytest.raises(ValueError):
+        list(IDoitStreamResponse([b"<html>Error</html>"]))
+
+
+def test_close_on_early_stop():
+    http_resp = FakeHTTPResponse()
+    resp = IDoitStreamResponse([b'{"result": [1, 2, 3], "id": 1}'], resp=http_resp)
+    rows = iter(resp)
+    assert next(rows) == 1
+    rows.close()
+    assert http_resp.closed
+
+
+def test_close_when_exhausted():
+    http_resp = FakeHTTPResponse()
+    resp = IDoitStreamResponse([b'{"result": [1], "id": 1}'], resp=http_resp)
+    assert list(resp) == [1]
+    assert http_resp.closed